@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 LEEP - University of Exeter (UK)
+# Mattia C. Mancini (m.c.mancini@exeter.ac.uk), October 2024
+"""
+pyCLMS: search and download Copernicus Land Monitoring Service data
+through the WEkEO HDA client.
+"""
+
+from pyclms.core.utils import osgrid2bbox, osgrid2bboxes, vector2bbox
+
+__all__ = ["osgrid2bbox", "osgrid2bboxes", "vector2bbox"]
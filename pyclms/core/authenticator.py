@@ -7,9 +7,29 @@ WEkEO HDA client.
 """
 
 import getpass
+import json
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
+import requests
 from hda import Client, Configuration
+from hda.api import SearchResults, convert
+from requests.adapters import HTTPAdapter, Retry
+
+# On-disk cache of the HDA access token, so that short-lived scripts do
+# not pay a network round trip to the WEkEO broker on every start.
+_TOKEN_CACHE_FILE = Path.home() / ".cache" / "pyclms" / "hda_token.json"
+
+# Minimum remaining lifetime, in seconds, required of a cached token
+# before it is reused rather than refreshed.
+_TOKEN_EXPIRY_MARGIN = 60
+
+# Assumed validity, in seconds, of a token supplied through the
+# HDA_TOKEN environment variable, which carries no expiry of its own.
+_ENV_TOKEN_LIFETIME = 1800
 
 
 class AuthenticationError(Exception):
@@ -27,6 +47,133 @@ class AuthenticationError(Exception):
         super().__init__(self.message)
 
 
+class SearchResult:
+    """
+    A lazily paginated view of a search query's matches.
+
+    Pages are fetched from the broker only as the result set is
+    iterated or indexed, and while a page is being consumed the next
+    one is prefetched in the background through the client's shared
+    connection pool, so iteration overlaps with network fetches and
+    peak memory stays bounded by what the caller actually reads.
+    len() and list() still work: they load as many pages as needed.
+
+    Parameters
+    ----------
+    client : hda.Client
+        The client used to submit the page requests.
+    query : dict
+        The search query, with the dataset_id already validated.
+    items_per_page : int (optional)
+        The number of matches fetched per page request.
+    limit : int (optional)
+        The maximum number of matches to expose; None means all.
+    """
+
+    def __init__(self, client, query, items_per_page=100, limit=None):
+        self.client = client
+        self.query = dict(query)
+        self.dataset = self.query.get("dataset_id")
+        self.items_per_page = items_per_page
+        self.limit = limit
+        self._results = []
+        self._total = None
+        self._prefetch = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def _fetch_page(self, start_index):
+        query = dict(self.query)
+        query.update(
+            {"startIndex": start_index, "itemsPerPage": self.items_per_page}
+        )
+        return self.client.post(query, "dataaccess/search")
+
+    def _load_next_page(self) -> bool:
+        """
+        Append the next page of matches to the loaded results, kicking
+        off a prefetch of the page after it. Returns False once all
+        matches are loaded.
+        """
+        if self._total is not None and len(self._results) >= self._total:
+            return False
+        if self._prefetch is not None:
+            page = self._prefetch.result()
+            self._prefetch = None
+        else:
+            page = self._fetch_page(len(self._results))
+        total = page["properties"]["totalResults"]
+        if self.limit is not None:
+            total = min(total, self.limit)
+        self._total = total
+        self._results.extend(page["features"][: total - len(self._results)])
+        if len(self._results) < self._total:
+            self._prefetch = self._executor.submit(
+                self._fetch_page, len(self._results)
+            )
+        else:
+            # All pages are loaded; release the prefetch thread rather
+            # than pinning it for the life of the process.
+            self._executor.shutdown(wait=False)
+        return True
+
+    @property
+    def results(self):
+        """The full list of matches, loading any remaining pages."""
+        while self._load_next_page():
+            pass
+        return self._results
+
+    def _as_hda_results(self) -> SearchResults:
+        """Materialize all matches into an hda.api.SearchResults."""
+        return SearchResults(self.client, self.results, self.dataset)
+
+    @property
+    def volume(self):
+        """The total size of all matches, loading any remaining pages."""
+        return self._as_hda_results().volume
+
+    def download(self, *args, **kwargs):
+        """
+        Download all matches, loading any remaining pages first and
+        delegating to hda.api.SearchResults.download.
+        """
+        return self._as_hda_results().download(*args, **kwargs)
+
+    def __iter__(self):
+        index = 0
+        while True:
+            while index >= len(self._results):
+                if not self._load_next_page():
+                    return
+            yield self._results[index]
+            index += 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.results[index]
+        if index < 0:
+            # Normalize against the full result count, which forces the
+            # total to be known; otherwise a negative index would read
+            # from whatever pages happen to be loaded.
+            index += len(self)
+            if index < 0:
+                raise IndexError("SearchResult index out of range")
+        while index >= len(self._results):
+            if not self._load_next_page():
+                break
+        return self._results[index]
+
+    def __len__(self):
+        if self._total is None:
+            self._load_next_page()
+        return self._total
+
+    def __repr__(self):
+        loaded = len(self._results)
+        total = "?" if self._total is None else self._total
+        return f"SearchResult[loaded={loaded},total={total}]"
+
+
 class ClientBuilder(Client):
     """
     A class to build the configuration file for the WEkEO HDA client.
@@ -38,6 +185,10 @@ class ClientBuilder(Client):
     ClientBuilder class, which is a child of the hda.Client class,
     and can be used to search for datasets and download data.
 
+    All requests issued through an instance share a single pooled
+    requests.Session, so route all searches and downloads of a session
+    through the same ClientBuilder instance to reuse connections.
+
     Parameters
     ----------
     user : str (optional)
@@ -50,7 +201,82 @@ class ClientBuilder(Client):
     def __init__(self, user: str = None, password: str = None):
         config = self._build_config(user=user, password=password)
         super().__init__(config=config)
-        self._validate_client(client=self)
+        # Pre-build the session with a pooled adapter so TLS handshakes
+        # to the broker are amortized across all search/download calls
+        # made through this instance.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                ),
+            ),
+        )
+        # An explicitly exported HDA_TOKEN takes precedence over any
+        # implicitly cached token: _validate_client seeds the client
+        # from the env var without touching the disk cache.
+        if os.getenv("HDA_TOKEN") or not self._load_cached_token():
+            self._validate_client(client=self)
+            self._save_token_cache()
+
+    def _load_cached_token(self) -> bool:
+        """
+        Load a previously cached access token from disk. Returns True if
+        an unexpired token for the configured user was found, in which
+        case the authentication round trip to the broker is skipped;
+        returns False on any error, falling back to the normal flow.
+        """
+        try:
+            cached = json.loads(_TOKEN_CACHE_FILE.read_text(encoding="utf-8"))
+            if cached["user"] != self.config.user:
+                return False
+            if cached["expiration"] < time.time() + _TOKEN_EXPIRY_MARGIN:
+                return False
+            self._access_token = cached["access_token"]
+            self._refresh_token = cached["refresh_token"]
+            self._token_expiration = cached["expiration"]
+            return True
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # TypeError covers caches that are valid JSON of the wrong
+            # shape, e.g. a list or a non-numeric expiration.
+            return False
+
+    def _save_token_cache(self) -> None:
+        """
+        Best-effort write of the current access token to the cache file.
+        The write is skipped when the contents would be unchanged, and
+        otherwise goes through a temporary file renamed into place, so a
+        crash mid-write can never leave a truncated cache behind. The
+        file is created with mode 0o600 since it holds credentials.
+        """
+        try:
+            cached = {
+                "user": self.config.user,
+                "access_token": self._access_token,
+                "refresh_token": self._refresh_token,
+                "expiration": self._token_expiration,
+            }
+            contents = json.dumps(cached).encode("utf-8")
+            try:
+                if _TOKEN_CACHE_FILE.read_bytes() == contents:
+                    return
+            except OSError:
+                pass
+            _TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=_TOKEN_CACHE_FILE.parent)
+            try:
+                os.write(fd, contents)
+            finally:
+                os.close(fd)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, _TOKEN_CACHE_FILE)
+        except (OSError, AttributeError):
+            pass
 
     def _build_config(self, user: str = None, password: str = None) -> Client:
         """
@@ -58,12 +284,13 @@ class ClientBuilder(Client):
         variables.
         """
         if user is None and password is None:
-            if (
-                os.getenv("HDA_USER") is not None
-                and os.getenv("HDA_PASSWORD") is not None
-            ):
-                user = os.getenv("HDA_USER")
-                password = os.getenv("HDA_PASSWORD")
+            # Bind the env vars once so the values used cannot change
+            # between the check and the assignment.
+            user_env = os.getenv("HDA_USER")
+            password_env = os.getenv("HDA_PASSWORD")
+            if user_env is not None and password_env is not None:
+                user = user_env
+                password = password_env
             else:
                 user = input("Enter your username: ")
                 password = getpass.getpass("Enter your password: ")
@@ -76,11 +303,59 @@ class ClientBuilder(Client):
         config = Configuration(user=user, password=password)
         return config
 
+    def search(self, query, limit=None) -> SearchResult:
+        """
+        Submit a search query and return a lazily paginated
+        SearchResult, which fetches pages from the broker on demand as
+        it is iterated and prefetches the next page in the background.
+        Use list(...) or the results attribute to load all matches
+        eagerly as hda.Client.search would.
+        """
+        query = convert(query)
+        assert "dataset_id" in query, "Missing dataset_id, check your query"
+        self.accept_tac(query["dataset_id"])
+        return SearchResult(self, query, limit=limit)
+
+    def search_many(self, queries: list, max_concurrency: int = 8) -> list:
+        """
+        Submit multiple search queries concurrently and return their
+        results as a list in input order. The requests are issued
+        through a thread pool against the shared connection pool, so
+        the network latency of the individual searches overlaps rather
+        than accumulating.
+
+        Parameters
+        ----------
+        queries : list of dict
+            The search queries, as accepted by hda.Client.search.
+        max_concurrency : int (optional)
+            The maximum number of searches in flight at once.
+        """
+
+        def _search(query):
+            result = self.search(query)
+            # Force the first page while still inside the pool;
+            # without this the lazy SearchResult would defer every
+            # fetch until the results are consumed serially.
+            len(result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(_search, queries))
+
     @staticmethod
     def _validate_client(client: Client) -> Client:
         """
         Method to validate the client and check for authentication errors.
         """
+        env_token = os.getenv("HDA_TOKEN")
+        if env_token:
+            # Trust an externally supplied token and skip the fetch from
+            # the broker; if it turns out to be stale, the hda client
+            # renews it transparently on first use.
+            client._access_token = env_token
+            client._token_expiration = int(time.time()) + _ENV_TOKEN_LIFETIME
+            return client
         try:
             _ = client.token
             return client
@@ -18,15 +18,24 @@ osgrid2bbox(gridref, os_cellsize)
     coordinates of the bounding box of the 1km, 10km grid or 100km grid
     squares.
 
+osgrid2bboxes(gridrefs, os_cellsize, epsg)
+    Vectorized version of osgrid2bbox: convert an iterable of British
+    National Grid references to bounding boxes in a single coordinate
+    transformation call.
+
 vector2bbox(vector_file)
     Retrieves the coordinates of the bounding box of an input vector
     file. This can be a shapefile or a GeoJSON file.
 """
 
-import re
-import geopandas as gpd
+import functools
+import os
+
+import numpy as np
 
-from pyproj import Transformer
+# geopandas and pyproj are imported lazily inside the functions that
+# need them: geopandas alone can add over a second to process start-up
+# and neither is needed for native-CRS gridref conversions.
 
 
 class BNGError(Exception):
@@ -60,10 +69,195 @@ def _init_regions_and_offsets():
         for j, region in enumerate(row):
             offset_map[region] = (1e5 * i, 1e5 * j)
 
-    return regions, offset_map
+    # Flatten the map into 26x26 lookup arrays indexed by the packed
+    # character codes of the two region letters; unused combinations
+    # hold the sentinel -1. A single multiply-add and array load then
+    # replaces the hash lookup, and batches can be resolved with one
+    # fancy-index operation.
+    offsets_x = np.full(676, -1, dtype=np.int32)
+    offsets_y = np.full(676, -1, dtype=np.int32)
+    for region, (x_offset, y_offset) in offset_map.items():
+        idx = (ord(region[0]) - 65) * 26 + (ord(region[1]) - 65)
+        offsets_x[idx] = int(x_offset)
+        offsets_y[idx] = int(y_offset)
+
+    return regions, offset_map, offsets_x, offsets_y
+
+
+_, _offset_map, _OFFSETS_X, _OFFSETS_Y = _init_regions_and_offsets()
+
+_VALID_CELLSIZES = frozenset({"1km", "10km", "100km"})
+
+_BAD_CELLSIZE_MESSAGE = (
+    "Invalid argument 'os_cellsize' supplied: "
+    "values can only be '1km', '10km' or '100km'"
+)
+
+# Per-cellsize parsing constants: (coord_len, scale_factor, bbox_side),
+# i.e. how many figures to read per axis, the metres per figure and the
+# side length of the resulting grid square.
+_RESCALE = {
+    "1km": (2, 1000, 1000),
+    "10km": (1, 10000, 10000),
+    "100km": (0, 0, 100000),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(epsg):
+    """
+    Return a Transformer from OSGB36 (EPSG:27700) to the given EPSG
+    code. Transformers are expensive to build, so they are memoized
+    per target CRS; pyproj Transformer objects are thread-safe for
+    transform() calls, so sharing the cached instance is safe.
+    """
+    from pyproj import Transformer
+
+    return Transformer.from_crs(27700, epsg, always_xy=True)
+
+
+def _bad_input_message(gridref):
+    """Error message for invalid grid reference inputs."""
+    return (
+        f"Valid gridref inputs are 2 characters and none, "
+        f"2, 4, 6, 8 or 10-fig references as strings "
+        f'e.g. "NN123321", or lists/tuples/arrays of strings. '
+        f"[{gridref}]"
+    )
+
+
+def _parse_gridref(gridref, os_cellsize):
+    """
+    Parse a BNG grid reference and return the corners of the bounding
+    box of the corresponding grid square as a (x_min, y_min, x_max,
+    y_max) tuple of integer OSGB36 (EPSG:27700) coordinates.
+    """
+    bad_input_message = _bad_input_message(gridref)
+
+    # All validation happens before any transformer is touched, so the
+    # error paths never pay for pyproj initialization. The isinstance
+    # check comes first: membership in a frozenset would itself raise
+    # TypeError for an unhashable os_cellsize.
+    if (
+        not isinstance(os_cellsize, str)
+        or os_cellsize not in _VALID_CELLSIZES
+    ):
+        raise BNGError(_BAD_CELLSIZE_MESSAGE)
+
+    # Non-string values raised an AttributeError or TypeError from the
+    # regex era's parsing; keep converting them to BNGError.
+    if not isinstance(gridref, str):
+        raise BNGError(bad_input_message)
+
+    gridref = gridref.upper()
+    if os_cellsize == "100km":
+        region = gridref[:2]
+        if len(region) != 2 or not region.isalpha():
+            raise BNGError(bad_input_message)
+    else:
+        # Each check is a single C-level string scan, which is cheaper
+        # than matching the equivalent alternation-heavy regex.
+        region, coords = gridref[:2], gridref[2:]
+        if (
+            not region.isalpha()
+            or not coords.isdigit()
+            or len(coords) not in (2, 4, 6, 8, 10)
+        ):
+            raise BNGError(bad_input_message)
+
+    # Get offset from region via the packed-character-code lookup
+    idx = (ord(region[0]) - 65) * 26 + (ord(region[1]) - 65)
+    if not 0 <= idx < 676 or _OFFSETS_X[idx] < 0:
+        raise BNGError(f"Invalid grid square code: {region}")
+    x_offset = int(_OFFSETS_X[idx])
+    y_offset = int(_OFFSETS_Y[idx])
+
+    coord_len, scale_factor, bbox_side = _RESCALE[os_cellsize]
+    if coord_len:
+        easting = int(coords[0:coord_len])
+        northing = int(coords[len(coords) // 2 : len(coords) // 2 + coord_len])
+    else:
+        easting = northing = 0
+
+    x_min = int(easting * scale_factor + x_offset)
+    y_min = int(northing * scale_factor + y_offset)
+    return x_min, y_min, x_min + bbox_side, y_min + bbox_side
+
 
+def osgrid2bboxes(gridrefs, os_cellsize, epsg):
+    """
+    Convert an iterable of British National Grid references to the
+    bounding boxes of the corresponding 1km, 10km or 100km grid squares
+    in a specified CRS.
+
+    This is the vectorized counterpart of osgrid2bbox: all grid
+    references are parsed first and the corner coordinates of every
+    bounding box are reprojected in a single Transformer.transform call,
+    amortizing the per-call overhead of the coordinate transformation
+    across the whole batch.
 
-_, _offset_map = _init_regions_and_offsets()
+    :param gridrefs: iterable of str - BNG grid references
+    :param os_cellsize: str - '1km', '10km' or '100km'
+    :param epsg: int - EPSG code for the desired CRS
+
+    :returns bboxes: list of dictionaries {x_min, x_max, y_min, y_max},
+        one per input grid reference, in input order.
+    """
+    corners = [_parse_gridref(gridref, os_cellsize) for gridref in gridrefs]
+    if epsg == 27700:
+        # Already in the native OSGB36 CRS; skip the no-op transform
+        return [
+            {"x_min": x_min, "x_max": x_max, "y_min": y_min, "y_max": y_max}
+            for x_min, y_min, x_max, y_max in corners
+        ]
+    num_refs = len(corners)
+    x_min = np.fromiter(
+        (corner[0] for corner in corners), dtype=float, count=num_refs
+    )
+    y_min = np.fromiter(
+        (corner[1] for corner in corners), dtype=float, count=num_refs
+    )
+    x_max = np.fromiter(
+        (corner[2] for corner in corners), dtype=float, count=num_refs
+    )
+    y_max = np.fromiter(
+        (corner[3] for corner in corners), dtype=float, count=num_refs
+    )
+
+    transformer = _get_transformer(epsg)
+    xs = np.concatenate([x_min, x_max])
+    ys = np.concatenate([y_min, y_max])
+    # pylint: disable=E0633
+    lons, lats = transformer.transform(xs, ys)
+    # pylint: enable=E0633
+    return [
+        {
+            "x_min": lons[i],
+            "x_max": lons[num_refs + i],
+            "y_min": lats[i],
+            "y_max": lats[num_refs + i],
+        }
+        for i in range(num_refs)
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _osgrid2bbox_cached(gridref, os_cellsize, epsg):
+    """
+    Cached scalar gridref conversion returning an immutable
+    (x_min, x_max, y_min, y_max) tuple. osgrid2bbox wraps the result in
+    a fresh dict, so callers can mutate what they get back without
+    corrupting the cache.
+    """
+    x_min, y_min, x_max, y_max = _parse_gridref(gridref, os_cellsize)
+    if epsg == 27700:
+        # Already in the native OSGB36 CRS; skip the no-op transform
+        return x_min, x_max, y_min, y_max
+    transformer = _get_transformer(epsg)
+    # pylint: disable=E0633
+    lons, lats = transformer.transform([x_min, x_max], [y_min, y_max])
+    # pylint: enable=E0633
+    return lons[0], lons[1], lats[0], lats[1]
 
 
 def osgrid2bbox(gridref, os_cellsize, epsg):
@@ -89,96 +283,28 @@ def osgrid2bbox(gridref, os_cellsize, epsg):
     >>> osgrid2bbox('NT2755062950', '1km', 27700)
     {'xmin': 327000, 'xmax':328000, 'ymin': 662000, 'ymax': 663000}
 
-    For multiple values, use Python's zip function and list comprehension
+    For multiple values, prefer osgrid2bboxes, which reprojects all
+    bounding boxes in a single call; a list comprehension also works
     >>> gridrefs = ['HU431392', 'SJ637560', 'TV374354']
     >>> [osgrid2bbox(g, '10km') for g in gridrefs]
     >>> [{'xmin': 440000, 'xmax': 450000, 'ymin': 1130000, 'ymax': 1140000},
         {'xmin': 360000, 'xmax': 370000, 'ymin': 330000, 'ymax': 340000},
         {'xmin': 530000, 'xmax': 540000, 'ymin': 70000, 'ymax': 80000}]
     """
-    # Validate input
-    bad_input_message = (
-        f"Valid gridref inputs are 2 characters and none, "
-        f"2, 4, 6, 8 or 10-fig references as strings "
-        f'e.g. "NN123321", or lists/tuples/arrays of strings. '
-        f"[{gridref}]"
+    # Reject invalid arguments before the cache: an unhashable gridref
+    # or os_cellsize (e.g. a list) would otherwise raise TypeError from
+    # lru_cache itself.
+    if not isinstance(gridref, str):
+        raise BNGError(_bad_input_message(gridref))
+    if (
+        not isinstance(os_cellsize, str)
+        or os_cellsize not in _VALID_CELLSIZES
+    ):
+        raise BNGError(_BAD_CELLSIZE_MESSAGE)
+    x_min, x_max, y_min, y_max = _osgrid2bbox_cached(
+        gridref, os_cellsize, epsg
     )
-
-    gridref = gridref.upper()
-    if os_cellsize in ["1km", "10km"]:
-        try:
-            pattern = r"^([A-Z]{2})(\d{2}|\d{4}|\d{6}|\d{8}|\d{10})$"
-            match = re.match(pattern, gridref)
-            # Extract data from gridref
-            region, coords = match.groups()
-        except (TypeError, AttributeError) as exc:
-            # Non-string values will throw error
-            raise BNGError(bad_input_message) from exc
-    elif os_cellsize == "100km":
-        try:
-            pattern = r"^([A-Z]{2})"
-            match = re.match(pattern, gridref)
-            # Extract data from gridref
-            region = match.groups()[0]
-        except (TypeError, AttributeError) as exc:
-            raise BNGError(bad_input_message) from exc
-    else:
-        raise BNGError(
-            "Invalid argument 'os_cellsize' supplied: "
-            "values can only be '10km' or '100km'"
-        )
-
-    # Get offset from region
-    try:
-        _offset_map[region]
-    except KeyError as exc:
-        raise BNGError(f"Invalid grid square code: {region}") from exc
-
-    rescaling = {
-        "1km": {"coord_len": 2, "scale_factor": 1e3},
-        "10km": {"coord_len": 1, "scale_factor": 1e4},
-    }
-
-    if os_cellsize == "100km":
-        x_min = int(_offset_map[region][0])
-        y_min = int(_offset_map[region][1])
-        x_max = int(_offset_map[region][0] + 1e5)
-        y_max = int(_offset_map[region][1] + 1e5)
-    elif os_cellsize in ["1km", "10km"]:
-        coord_len = rescaling[os_cellsize]["coord_len"]
-        scale_factor = rescaling[os_cellsize]["scale_factor"]
-        easting = int(coords[0:coord_len])
-        northing = int(
-            coords[int(len(coords) / 2) : int(len(coords) / 2) + coord_len]
-        )
-        x_min = int(easting * scale_factor + _offset_map[region][0])
-        y_min = int(northing * scale_factor + _offset_map[region][1])
-        x_max = int(easting * scale_factor + _offset_map[region][0] + 1e4)
-        y_max = int(northing * scale_factor + _offset_map[region][1] + 1e4)
-    else:
-        raise BNGError(
-            "Invalid argument 'os_cellsize' "
-            "supplied: values can only be '10km' or '100km'"
-        )
-
-    bbox_27700 = {"xmin": x_min, "xmax": x_max, "ymin": y_min, "ymax": y_max}
-
-    transformer = Transformer.from_crs(27700, epsg, always_xy=True)
-    # pylint: disable=E0633
-    min_lon, min_lat = transformer.transform(
-        bbox_27700["xmin"], bbox_27700["ymin"]
-    )
-    max_lon, max_lat = transformer.transform(
-        bbox_27700["xmax"], bbox_27700["ymax"]
-    )
-    # pylint: enable=E0633
-    bbox = {
-        "x_min": min_lon,
-        "x_max": max_lon,
-        "y_min": min_lat,
-        "y_max": max_lat,
-    }
-    return bbox
+    return {"x_min": x_min, "x_max": x_max, "y_min": y_min, "y_max": y_max}
 
 
 def vector2bbox(vector_file):
@@ -186,12 +312,41 @@ def vector2bbox(vector_file):
     Retrieves the coordinates of the bounding box of an input vector
     file. This can be a variety of spatial vector files such as
     shapefiles, geoJSON, KML, GPKG, GML DXF, etc.
+
+    Results are memoized per (absolute path, modification time), so
+    repeated reads of an unchanged file cost a dict lookup instead of
+    re-parsing the file.
     """
-    gdf = gpd.read_file(vector_file)
-    bbox = gdf.total_bounds
-    return {
-        "x_min": float(bbox[0]),
-        "x_max": float(bbox[2]),
-        "y_min": float(bbox[1]),
-        "y_max": float(bbox[3]),
-    }
+    mtime_ns = os.stat(vector_file).st_mtime_ns
+    x_min, x_max, y_min, y_max = _vector2bbox_cached(
+        os.path.abspath(vector_file), mtime_ns
+    )
+    return {"x_min": x_min, "x_max": x_max, "y_min": y_min, "y_max": y_max}
+
+
+@functools.lru_cache(maxsize=128)
+def _vector2bbox_cached(vector_file, mtime_ns):
+    """
+    Cached extent lookup returning an immutable (x_min, x_max, y_min,
+    y_max) tuple; the mtime_ns key invalidates stale entries when the
+    file changes on disk.
+
+    Where possible the extent is read from the layer metadata through
+    pyogrio, which most OGR drivers report without parsing a single
+    geometry; only if pyogrio is unavailable or the driver cannot
+    provide the extent is the whole file loaded through geopandas.
+    """
+    bbox = None
+    try:
+        from pyogrio import read_info
+
+        bbox = read_info(vector_file)["total_bounds"]
+    except ImportError:
+        bbox = None
+
+    if bbox is None:
+        import geopandas as gpd
+
+        bbox = gpd.read_file(vector_file).total_bounds
+
+    return float(bbox[0]), float(bbox[2]), float(bbox[1]), float(bbox[3])
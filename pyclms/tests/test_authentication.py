@@ -5,12 +5,19 @@
 Tests for the procedures to authenticate users to the WEkEO HDA client.
 """
 
+import json
 import os
+import time
 from unittest import mock
 
 import pytest
 
-from pyclms.core.authenticator import AuthenticationError, ClientBuilder
+from pyclms.core import authenticator
+from pyclms.core.authenticator import (
+    AuthenticationError,
+    ClientBuilder,
+    SearchResult,
+)
 
 
 class Configuration:
@@ -23,6 +30,45 @@ class Configuration:
         self.password = password
 
 
+@pytest.fixture(autouse=True)
+def isolated_auth(monkeypatch, tmp_path):
+    """
+    Keep every test hermetic against the real environment: no ambient
+    HDA_TOKEN and a per-test token cache file, so an exported token or
+    a (possibly corrupted) real cache cannot change test outcomes.
+    """
+    monkeypatch.delenv("HDA_TOKEN", raising=False)
+    monkeypatch.setattr(
+        authenticator, "_TOKEN_CACHE_FILE", tmp_path / "hda_token.json"
+    )
+
+
+def _fake_client_init(self, config=None):
+    """
+    Stand-in for hda.Client.__init__ that records the config and seeds
+    the token attributes the cache helpers rely on.
+    """
+    self.config = config
+    self._access_token = None
+    self._refresh_token = None
+    self._token_expiration = None
+
+
+def _write_token_cache(expiration, user="test_user"):
+    """Write a token cache file as a previous session would have."""
+    authenticator._TOKEN_CACHE_FILE.write_text(
+        json.dumps(
+            {
+                "user": user,
+                "access_token": "cached_token",
+                "refresh_token": "cached_refresh",
+                "expiration": expiration,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
 def test_auth_success():
     """
     Test that the ClientBuilder class is correctly initialised with
@@ -77,3 +123,187 @@ def test_env_var_setup():
         assert os.getenv("HDA_USER") == "mocked_user"
         assert os.getenv("HDA_PASSWORD") == "mocked_password"
         assert client.token == "mocked_token"
+
+
+def test_auth_env_token(monkeypatch):
+    """
+    Test that an exported HDA_TOKEN seeds the client directly, without
+    fetching a token from the broker.
+    """
+    with mock.patch("hda.Configuration", Configuration), mock.patch(
+        "hda.Client.__init__", _fake_client_init
+    ), mock.patch(
+        "hda.Client.token", new_callable=mock.PropertyMock
+    ) as mock_token:
+        mock_token.side_effect = Exception("token must not be fetched")
+        monkeypatch.setenv("HDA_TOKEN", "env_token")
+        client = ClientBuilder(user="test_user", password="test_password")
+        assert client._access_token == "env_token"
+
+
+def test_auth_env_token_overrides_cache(monkeypatch):
+    """
+    Test that an exported HDA_TOKEN takes precedence over an unexpired
+    cached token.
+    """
+    with mock.patch("hda.Configuration", Configuration), mock.patch(
+        "hda.Client.__init__", _fake_client_init
+    ), mock.patch(
+        "hda.Client.token", new_callable=mock.PropertyMock
+    ) as mock_token:
+        mock_token.side_effect = Exception("token must not be fetched")
+        _write_token_cache(expiration=time.time() + 3600)
+        monkeypatch.setenv("HDA_TOKEN", "env_token")
+        client = ClientBuilder(user="test_user", password="test_password")
+        assert client._access_token == "env_token"
+
+
+def test_auth_cached_token_reused():
+    """
+    Test that an unexpired cached token for the configured user is
+    reused without a network round trip.
+    """
+    with mock.patch("hda.Configuration", Configuration), mock.patch(
+        "hda.Client.__init__", _fake_client_init
+    ), mock.patch(
+        "hda.Client.token", new_callable=mock.PropertyMock
+    ) as mock_token:
+        mock_token.side_effect = Exception("token must not be fetched")
+        _write_token_cache(expiration=time.time() + 3600)
+        client = ClientBuilder(user="test_user", password="test_password")
+        assert client._access_token == "cached_token"
+        assert client._refresh_token == "cached_refresh"
+
+
+def test_auth_expired_cached_token_refetched():
+    """
+    Test that an expired cached token triggers a fresh validation
+    instead of being reused.
+    """
+    with mock.patch("hda.Configuration", Configuration), mock.patch(
+        "hda.Client.__init__", _fake_client_init
+    ), mock.patch(
+        "hda.Client.token", new_callable=mock.PropertyMock
+    ) as mock_token:
+        mock_token.return_value = "fresh_token"
+        _write_token_cache(expiration=time.time() - 10)
+        _ = ClientBuilder(user="test_user", password="test_password")
+        mock_token.assert_called()
+
+
+def test_auth_corrupted_cache_ignored():
+    """
+    Test that a corrupted cache file falls back to the normal
+    authentication flow instead of crashing the construction.
+    """
+    authenticator._TOKEN_CACHE_FILE.write_text("[]", encoding="utf-8")
+    with mock.patch("hda.Configuration", Configuration), mock.patch(
+        "hda.Client.__init__", _fake_client_init
+    ), mock.patch(
+        "hda.Client.token", new_callable=mock.PropertyMock
+    ) as mock_token:
+        mock_token.return_value = "mocked_token"
+        _ = ClientBuilder(user="test_user", password="test_password")
+        mock_token.assert_called()
+
+
+def test_auth_token_cache_saved(monkeypatch):
+    """
+    Test that a validated token is persisted to the cache file with
+    owner-only permissions.
+    """
+    with mock.patch("hda.Configuration", Configuration), mock.patch(
+        "hda.Client.__init__", _fake_client_init
+    ), mock.patch(
+        "hda.Client.token", new_callable=mock.PropertyMock
+    ):
+        monkeypatch.setenv("HDA_TOKEN", "env_token")
+        _ = ClientBuilder(user="test_user", password="test_password")
+    cache_file = authenticator._TOKEN_CACHE_FILE
+    assert cache_file.exists()
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cached["user"] == "test_user"
+    assert cached["access_token"] == "env_token"
+
+
+class PagedStub:
+    """
+    Stub client serving deterministic paginated search responses, to
+    exercise SearchResult without a network.
+    """
+
+    stream = None
+
+    def __init__(self, total):
+        self.total = total
+        self.page_requests = []
+
+    def post(self, query, action):
+        start = query["startIndex"]
+        stop = min(start + query["itemsPerPage"], self.total)
+        self.page_requests.append(start)
+        return {
+            "features": [{"id": i} for i in range(start, stop)],
+            "properties": {"startIndex": start, "totalResults": self.total},
+        }
+
+
+def test_search_result_lazy_pagination():
+    """
+    Test that SearchResult fetches pages on demand and supports len,
+    iteration, indexing and slicing across page boundaries.
+    """
+    stub = PagedStub(total=5)
+    result = SearchResult(stub, {"dataset_id": "ds"}, items_per_page=2)
+    assert stub.page_requests == []
+    assert len(result) == 5
+    assert list(result) == [{"id": i} for i in range(5)]
+    assert result[0] == {"id": 0}
+    assert result[-1] == {"id": 4}
+    assert result[1:3] == [{"id": 1}, {"id": 2}]
+    assert sorted(stub.page_requests) == [0, 2, 4]
+    assert result.dataset == "ds"
+    assert result.volume == 0
+
+
+def test_search_result_limit():
+    """Test that the limit caps both len() and the loaded matches."""
+    result = SearchResult(
+        PagedStub(total=6), {"dataset_id": "ds"}, items_per_page=2, limit=3
+    )
+    assert len(result) == 3
+    assert list(result) == [{"id": i} for i in range(3)]
+
+
+def test_search_result_negative_index_out_of_range():
+    """Test that an out-of-range negative index raises IndexError."""
+    result = SearchResult(PagedStub(total=4), {"dataset_id": "ds"})
+    with pytest.raises(IndexError):
+        _ = result[-5]
+
+
+def test_search_result_releases_prefetch_thread():
+    """Test that the prefetch executor is shut down once exhausted."""
+    result = SearchResult(
+        PagedStub(total=5), {"dataset_id": "ds"}, items_per_page=2
+    )
+    _ = list(result)
+    assert result._executor._shutdown
+
+
+def test_search_many_preserves_order():
+    """Test that search_many returns results in query order."""
+    with mock.patch("hda.Configuration", Configuration), mock.patch(
+        "hda.Client.__init__", _fake_client_init
+    ), mock.patch(
+        "hda.Client.token", new_callable=mock.PropertyMock
+    ) as mock_token:
+        mock_token.return_value = "mocked_token"
+        client = ClientBuilder(user="test_user", password="test_password")
+    queries = [{"idx": i} for i in range(5)]
+    with mock.patch.object(
+        ClientBuilder, "search", side_effect=lambda q: [q["idx"]]
+    ):
+        results = client.search_many(queries, max_concurrency=3)
+    assert results == [[0], [1], [2], [3], [4]]
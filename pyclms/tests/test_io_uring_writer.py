@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 LEEP - University of Exeter (UK)
+# Mattia C. Mancini (m.c.mancini@exeter.ac.uk), October 2024
+"""
+Testing of procedures for the batched tile writer.
+"""
+
+from pyclms.core import io_uring_writer
+from pyclms.core.io_uring_writer import write_all
+
+
+def test_write_all_roundtrip(tmp_path):
+    """Test that every (path, bytes) pair in a batch is written."""
+    pairs = [(tmp_path / f"tile_{i}.bin", bytes([i]) * 16) for i in range(4)]
+    write_all(pairs)
+    for path, data in pairs:
+        assert path.read_bytes() == data
+
+
+def test_write_all_accepts_str_paths(tmp_path):
+    """Test that paths can be given as strings as well as Path."""
+    path = tmp_path / "tile.bin"
+    write_all([(str(path), b"data")])
+    assert path.read_bytes() == b"data"
+
+
+def test_io_uring_availability_probe(monkeypatch):
+    """Test the package, platform and kernel-version checks."""
+    monkeypatch.setattr(io_uring_writer, "UringFileIO", None)
+    assert io_uring_writer._io_uring_available() is False
+
+    monkeypatch.setattr(io_uring_writer, "UringFileIO", object())
+    monkeypatch.setattr(io_uring_writer.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(
+        io_uring_writer.platform, "release", lambda: "5.15.0-generic"
+    )
+    assert io_uring_writer._io_uring_available() is True
+    monkeypatch.setattr(
+        io_uring_writer.platform, "release", lambda: "5.4.0-generic"
+    )
+    assert io_uring_writer._io_uring_available() is False
+    monkeypatch.setattr(io_uring_writer.platform, "release", lambda: "weird")
+    assert io_uring_writer._io_uring_available() is False
+    monkeypatch.setattr(io_uring_writer.platform, "system", lambda: "Darwin")
+    assert io_uring_writer._io_uring_available() is False
+
+
+def test_write_all_falls_back_when_uring_fails(tmp_path, monkeypatch):
+    """
+    Test that a failing uring batch (e.g. io_uring_setup blocked by
+    seccomp) degrades to the synchronous writes.
+    """
+
+    def _blocked(path_bytes_pairs):
+        raise OSError("io_uring_setup blocked")
+
+    monkeypatch.setattr(io_uring_writer, "_io_uring_available", lambda: True)
+    monkeypatch.setattr(io_uring_writer, "_write_all_uring", _blocked)
+    path = tmp_path / "tile.bin"
+    write_all([(path, b"data")])
+    assert path.read_bytes() == b"data"